@@ -2,15 +2,12 @@ from utils import Stats, BaseCharacter, Attack, Damage
 
 
 class Ninja(BaseCharacter):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the character."""
-		return "Ninja"
+	__slots__ = ()
 
-	@property
-	def special_attack_name(self) -> str:
-		"""Returns the name of the character's special attack."""
-		return "Special Attack: A precise poisoned dagger shot designed to incapacitate most opponents"
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Ninja"
+	special_attack_name = "Special Attack: A precise poisoned dagger shot designed to incapacitate most opponents"
 
 	@property
 	def special_attack(self) -> Attack:
@@ -35,15 +32,12 @@ class Ninja(BaseCharacter):
 
 
 class Mage(BaseCharacter):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the character."""
-		return "Mage"
+	__slots__ = ()
 
-	@property
-	def special_attack_name(self) -> str:
-		"""Returns the name of the character's special attack."""
-		return "Special Attack: A lullaby to deep sleep"
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Mage"
+	special_attack_name = "Special Attack: A lullaby to deep sleep"
 
 	@property
 	def special_attack(self) -> Attack:
@@ -68,15 +62,12 @@ class Mage(BaseCharacter):
 
 
 class Warrior(BaseCharacter):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the character."""
-		return "Warrior"
+	__slots__ = ()
 
-	@property
-	def special_attack_name(self) -> str:
-		"""Returns the name of the character's special attack."""
-		return "Special Attack: A call to the shield hero"
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Warrior"
+	special_attack_name = "Special Attack: A call to the shield hero"
 
 	@property
 	def special_attack(self) -> Attack:
@@ -1,4 +1,18 @@
-import json
+# Fastest available JSON parser wins: orjson, then rapidjson, then ujson,
+# then the stdlib, so the game stays dependency-free when none of the
+# accelerated parsers is installed. All of them accept bytes input.
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import rapidjson as _json
+    except ImportError:
+        try:
+            import ujson as _json
+        except ImportError:
+            import json as _json
+
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Type
 from characters import Ninja, Mage, Warrior
@@ -21,6 +35,26 @@ name_to_item_class: Dict[str, Type[BaseItem]] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _make_stats(stat_items: tuple) -> Stats:
+    """
+    Builds a Stats instance from a tuple of (field, value) pairs, caching
+    the result.
+
+    Assignment files reuse identical stat templates across characters and
+    items; Stats is an immutable NamedTuple, so the cached instances can be
+    shared freely and repeated templates skip the kwargs construction.
+
+    Args:
+        stat_items: Sorted (field, value) pairs for the Stats constructor.
+
+    Returns:
+        The (possibly shared) Stats instance.
+    """
+
+    return Stats(**dict(stat_items))
+
+
 def read_data(team_assignment: Path) -> list[BaseCharacter]:
     """
     Reads character and item data from a JSON file and creates respective
@@ -33,8 +67,7 @@ def read_data(team_assignment: Path) -> list[BaseCharacter]:
         A list of character instances.
     """
 
-    with open(team_assignment, "r") as f:
-        read_assignment = json.load(f)
+    read_assignment = _json.loads(team_assignment.read_bytes())
 
     character_list = []
     for character_data in read_assignment:
@@ -43,7 +76,7 @@ def read_data(team_assignment: Path) -> list[BaseCharacter]:
         character_stats.update({"current_hp": character_stats["hp"],
                                 "total_hp": character_stats["hp"]})
         del character_stats["hp"]
-        character_stats = Stats(**character_stats)
+        character_stats = _make_stats(tuple(sorted(character_stats.items())))
         new_character = name_to_character_class[character_name](base_stats=character_stats)
         if "items" in character_data:
             for item_data in character_data["items"]:
@@ -53,7 +86,7 @@ def read_data(team_assignment: Path) -> list[BaseCharacter]:
                     item_stats.update({"current_hp": item_stats["hp"],
                                        "total_hp": item_stats["hp"]})
                     del item_stats["hp"]
-                item_stats = Stats(**item_stats)
+                item_stats = _make_stats(tuple(sorted(item_stats.items())))
                 item = name_to_item_class[item_name](base_item_stats=item_stats)
                 new_character.add_item(item)
         character_list.append(new_character)
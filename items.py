@@ -2,35 +2,13 @@ from utils import Stats, BaseItem
 
 
 class EnchantedSword(BaseItem):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the item."""
-		return "Enchanted Sword"
+	__slots__ = ()
 
-	@property
-	def passive_name(self) -> str:
-		"""Returns the name of the item and its special ability."""
-		return f"{self.name}: Lucky Strike"
-
-	@property
-	def is_unique_passive(self) -> bool:
-		"""Returns whether an item has a unique passive effect."""
-		return True
-
-	def get_stats(self) -> str:
-		"""
-		Overridden from BaseItem.
-
-		This method returns a string illustrating the specific stats of an EnchantedSword item.
-
-		This method is used in the 'game.py', within the 'print_character_list()' function
-		to print the stats of each item	owned by a character in a readable format.
-
-		Returns:
-			A string containing the stats of the EnchantedSword.
-		"""
-		return (f"Physical Power: {self.base_item_stats.physical_power}\n"
-				f"						Magic Power: {self.base_item_stats.magic_power}")
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Enchanted Sword"
+	passive_name = "Enchanted Sword: Lucky Strike"
+	is_unique_passive = True
 
 	def calculate_effective_stats(self, base_character_stats: Stats) -> Stats:
 		"""
@@ -52,35 +30,13 @@ class EnchantedSword(BaseItem):
 
 
 class ShinyStaff(BaseItem):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the item."""
-		return "Shiny Staff"
-
-	@property
-	def passive_name(self) -> str:
-		"""Returns the name of the item and its special ability."""
-		return f"{self.name}: Blessings of Echo"
-
-	@property
-	def is_unique_passive(self) -> bool:
-		"""Returns whether an item has a unique passive effect."""
-		return False
-
-	def get_stats(self) -> str:
-		"""
-		Overridden from BaseItem.
+	__slots__ = ()
 
-		This method returns a string illustrating the specific stats of a ShinyStaff item.
-
-		This method is used in the 'game.py', within the 'print_character_list()' function
-		to print the stats of each item	owned by a character in a readable format.
-
-		Returns:
-			A string containing the stats of the ShinyStaff.
-		"""
-		return (f"Physical Power: {self.base_item_stats.physical_power}\n"
-				f"						Magic Power: {self.base_item_stats.magic_power}")
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Shiny Staff"
+	passive_name = "Shiny Staff: Blessings of Echo"
+	is_unique_passive = False
 
 	def calculate_effective_stats(self, base_character_stats: Stats) -> Stats:
 		"""
@@ -106,35 +62,13 @@ class ShinyStaff(BaseItem):
 
 
 class Pole(BaseItem):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the item."""
-		return "Pole"
-
-	@property
-	def passive_name(self) -> str:
-		"""Returns the name of the item and its special ability."""
-		return f"{self.name}: No passive abilities"
-
-	@property
-	def is_unique_passive(self) -> bool:
-		"""Returns whether an item has a unique passive effect."""
-		return False
-
-	def get_stats(self) -> str:
-		"""
-		Overridden from BaseItem.
-
-		This method returns a string illustrating the specific stats of a Pole item.
-
-		This method is used in the 'game.py', within the 'print_character_list()' function
-		to print the stats of each item	owned by a character in a readable format.
+	__slots__ = ()
 
-		Returns:
-			A string containing the stats of the Pole.
-		"""
-		return (f"Physical Power: {self.base_item_stats.physical_power}\n"
-				f"						Magic Power: {self.base_item_stats.magic_power}")
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Pole"
+	passive_name = "Pole: No passive abilities"
+	is_unique_passive = False
 
 	def calculate_effective_stats(self, base_character_stats: Stats) -> Stats:
 		"""
@@ -154,20 +88,13 @@ class Pole(BaseItem):
 
 
 class MagicCauldron(BaseItem):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the item."""
-		return "Magic Cauldron"
+	__slots__ = ()
 
-	@property
-	def passive_name(self) -> str:
-		"""Returns the name of the item and its special ability."""
-		return f"{self.name}: Potion of Life"
-
-	@property
-	def is_unique_passive(self) -> bool:
-		"""Returns whether an item has a unique passive effect."""
-		return True
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Magic Cauldron"
+	passive_name = "Magic Cauldron: Potion of Life"
+	is_unique_passive = True
 
 	def get_stats(self) -> str:
 		"""
@@ -208,20 +135,13 @@ class MagicCauldron(BaseItem):
 
 
 class SolidRock(BaseItem):
-	@property
-	def name(self) -> str:
-		"""Returns the name of the item."""
-		return "Solid Rock"
-
-	@property
-	def passive_name(self) -> str:
-		"""Returns the name of the item and its special ability."""
-		return f"{self.name}: No passive abilities"
-
-	@property
-	def is_unique_passive(self) -> bool:
-		"""Returns whether an item has a unique passive effect."""
-		return False
+	__slots__ = ()
+
+	# Constant per class, so plain class attributes: reading them skips the
+	# property descriptor call a method-based implementation would pay.
+	name = "Solid Rock"
+	passive_name = "Solid Rock: No passive abilities"
+	is_unique_passive = False
 
 	def get_stats(self) -> str:
 		"""
@@ -0,0 +1,57 @@
+"""
+One-shot build step that minifies team assignment JSON files in place.
+
+JSON parsers spend a measurable share of their time skipping insignificant
+whitespace, so pretty-printed assignment files parse slower than minified
+ones. Run this over an assignments directory before large simulation
+sweeps; the documents themselves are unchanged, only their formatting.
+"""
+
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _minify(payload: bytes) -> bytes:
+        return orjson.dumps(orjson.loads(payload))
+except ImportError:
+    import json
+
+    def _minify(payload: bytes) -> bytes:
+        return json.dumps(json.loads(payload), separators=(",", ":")).encode()
+
+
+def minify_assignments(root: Path) -> int:
+    """
+    Minifies every .json file under the given directory in place.
+
+    Args:
+        root: The directory to walk for assignment files.
+
+    Returns:
+        The number of files rewritten.
+    """
+
+    rewritten = 0
+    for path in sorted(root.rglob("*.json")):
+        payload = path.read_bytes()
+        minified = _minify(payload)
+        if minified != payload:
+            path.write_bytes(minified)
+            rewritten += 1
+
+    return rewritten
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser()
+    parser.add_argument("--assignments_dir",
+                        type=str,
+                        help="The directory containing assignment JSON files to minify",
+                        default="./samples",
+                        required=False)
+    args = parser.parse_args()
+    count = minify_assignments(Path(args.assignments_dir))
+    print(f"Minified {count} assignment file(s)")
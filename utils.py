@@ -1,10 +1,14 @@
-from typing import NamedTuple, Any
-from copy import deepcopy
+from collections import Counter
+from functools import lru_cache
+from typing import ClassVar, NamedTuple, Any
 import abc
+import sys
 import numpy as np
 
 
 class RngEngine:
+	_BUFFER_SIZE = 4096
+
 	def __init__(self, seed: int = 56) -> None:
 		"""Create the RNG backend for the game
 
@@ -15,6 +19,8 @@ class RngEngine:
 			seed -- the pseudo rng seed to use (default: {56})
 		"""
 		self._rand = np.random.default_rng(seed=seed)
+		self._buffer = self._rand.random(self._BUFFER_SIZE)
+		self._buffer_index = 0
 
 	def rng(self, probability: float) -> bool:
 		"""Roll a die with the probability and see if the result is
@@ -30,7 +36,48 @@ class RngEngine:
 			Whether the expected outcome was rolled.
 				True if it was, False otherwise
 		"""
-		return self._rand.random() < (probability / 100)
+		# Draws are pre-generated in blocks: indexing into the buffer yields
+		# the exact same stream as repeated scalar random() calls, while
+		# amortizing the per-call NumPy dispatch cost over the whole block.
+		if self._buffer_index >= self._BUFFER_SIZE:
+			self._buffer = self._rand.random(self._BUFFER_SIZE)
+			self._buffer_index = 0
+
+		value = self._buffer[self._buffer_index]
+		self._buffer_index += 1
+		return bool(value < (probability * 0.01))
+
+	def rng_batch(self, probabilities: np.ndarray) -> np.ndarray:
+		"""Roll one die per entry of probabilities in a single vectorized pass.
+
+		The draws are taken from the same buffered stream as rng(), so
+		interleaving scalar and batch rolls keeps the seeded sequence
+		reproducible: n batch rolls consume exactly the draws that n
+		scalar rng() calls would have.
+
+		Arguments:
+			probabilities -- the probabilities of rolling the expected outcomes,
+				numbers from [0-100]
+
+		Returns:
+			A boolean array of which expected outcomes were rolled.
+		"""
+		probabilities = np.asarray(probabilities)
+		count = probabilities.shape[0]
+		draws = np.empty(count)
+
+		filled = 0
+		while filled < count:
+			if self._buffer_index >= self._BUFFER_SIZE:
+				self._buffer = self._rand.random(self._BUFFER_SIZE)
+				self._buffer_index = 0
+
+			take = min(count - filled, self._BUFFER_SIZE - self._buffer_index)
+			draws[filled:filled + take] = self._buffer[self._buffer_index:self._buffer_index + take]
+			self._buffer_index += take
+			filled += take
+
+		return draws < (probabilities * 0.01)
 
 
 class Stats(NamedTuple):
@@ -81,13 +128,31 @@ class Stats(NamedTuple):
 		"""
 		Returns a formatted string providing detailed information about the object's attributes.
 		"""
-		return f"""current_hp = {self.current_hp},
-		total_hp = {self.total_hp},
-		armor = {self.armor},
-		magic_resistance = {self.magic_resistance},
-		physical_power = {self.physical_power},
-		magic_power = {self.magic_power},
-		special_trigger_chance = {self.special_trigger_chance}
+		return _fmt_stats(self)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_stats(stats: Stats) -> str:
+	"""
+	Formats a Stats instance for display, caching the result.
+
+	Stats is an immutable NamedTuple, so repeated prints of the same stats
+	(common when rendering rosters and combat breakdowns) return the cached
+	string instead of re-running the multi-line format.
+
+	Args:
+		stats (Stats): The stats to format.
+
+	Returns:
+		str: The formatted representation.
+	"""
+	return f"""current_hp = {stats.current_hp},
+		total_hp = {stats.total_hp},
+		armor = {stats.armor},
+		magic_resistance = {stats.magic_resistance},
+		physical_power = {stats.physical_power},
+		magic_power = {stats.magic_power},
+		special_trigger_chance = {stats.special_trigger_chance}
 		"""
 
 
@@ -128,6 +193,9 @@ class BaseItem(abc.ABC):
 	The class serves as a contract for what each item should include
 	"""
 
+	# Slot storage keeps instances dict-free, mirroring BaseCharacter.
+	__slots__ = ("base_item_stats", "is_passive_active", "_name_cache")
+
 	def __init__(self, base_item_stats: Stats, is_passive_active: bool = True) -> None:
 		"""
 		Initialize an instance of the BaseItem class
@@ -138,62 +206,55 @@ class BaseItem(abc.ABC):
 		"""
 		self.base_item_stats = base_item_stats
 		self.is_passive_active = is_passive_active
+		# Interned so equality and hashing degrade to pointer comparisons.
+		self._name_cache = sys.intern(self.name)
+
+	# Per-subclass constants. Declared as plain class attributes rather than
+	# abstract properties so every read is a direct lookup instead of a
+	# property.__get__ call; __init_subclass__ enforces that concrete
+	# subclasses define all three.
+	#
+	# name: The name of the item.
+	# passive_name: The name and passive effect of the item.
+	# is_unique_passive: Whether the item has a unique passive. A unique
+	# 	passive means that the passive stat changes from multiple copies of
+	# 	the same item will not stack; if a character carries several items
+	# 	with the same unique passive, only one passive of this kind will be
+	# 	active.
+	name: ClassVar[str]
+	passive_name: ClassVar[str]
+	is_unique_passive: ClassVar[bool]
+
+	def __init_subclass__(cls, **kwargs: Any) -> None:
+		"""
+		Checks that concrete subclasses declare the required class constants.
 
-	@property
-	@abc.abstractmethod
-	def name(self) -> str:
-		"""
-		Abstract method representing a 'name' property.
-
-		This method is intended to be overridden in subclasses to
-		return the name of the item as a string.
-
-		Returns:
-			str: The name of the item
-		"""
-		pass
-
-	@property
-	@abc.abstractmethod
-	def passive_name(self) -> str:
-		"""
-		Abstract method representing a 'passive_name' property
-
-		This property is intended to be overridden in subclasses to
-		return the passive name of the item as a string.
-
-		Returns:
-			str: The name and passive effect of the item.
-		"""
-		pass
+		Raises:
+			TypeError: If 'name', 'passive_name' or 'is_unique_passive' is
+				missing on a non-abstract subclass.
+		"""
+		super().__init_subclass__(**kwargs)
+		if abc.ABC in cls.__bases__:
+			return
+		for attribute in ("name", "passive_name", "is_unique_passive"):
+			if not hasattr(cls, attribute):
+				raise TypeError(
+					f"{cls.__name__} must define the class attribute '{attribute}'"
+				)
 
-	@property
-	@abc.abstractmethod
-	def is_unique_passive(self) -> bool:
+	def get_stats(self) -> str:
 		"""
-		Abstract property that should return whether the item has a unique passive.
+		Returns a string representation of the item's stats.
 
-		A unique passive means that the passive stat changes from multiple copies of the same item
-		will not stack. If a character carries several items with the same unique passive,
-		only one passive of this kind will be active.
-
-		This property should be implemented in each subclass of BaseItem.
+        Most items are described by their power stats, so this default covers
+        them; items whose defining stats differ (e.g. defensive or hp items)
+        override it to illustrate their own attributes.
 
 		Returns:
-			bool: True if the item has a unique passive, False otherwise.
-		"""
-		pass
-
-	@abc.abstractmethod
-	def get_stats(self) -> str:
-		"""
-		Abstract method for subclasses to override.
-
-        This method should return a string representation of the item's stats.
-        In each subclass, this method should concatenate the different attributes into a single string
-        that illustrates the specific stats of the item.
+			A string containing the stats of the item.
         """
-		pass
+		return (f"Physical Power: {self.base_item_stats.physical_power}\n"
+				f"						Magic Power: {self.base_item_stats.magic_power}")
 
 	@abc.abstractmethod
 	def calculate_effective_stats(self, base_character_stats: Stats) -> Stats:
@@ -228,9 +289,21 @@ class BaseItem(abc.ABC):
 		"""
 
 		if isinstance(other, BaseItem):
-			return self.name == other.name
+			return self._name_cache is other._name_cache
 		return False
 
+	def __hash__(self) -> int:
+		"""
+		Returns a hash consistent with __eq__, based on the item's name.
+
+		This makes items usable in sets and as dict keys, where equal-named
+		items collapse to one entry.
+
+		Returns:
+			int: The hash of the item's name.
+		"""
+		return hash(self._name_cache)
+
 
 class BaseCharacter(abc.ABC):
 	"""
@@ -245,6 +318,11 @@ class BaseCharacter(abc.ABC):
         items (list[BaseItem]): items held by the character
     """
 
+	# Slot storage keeps instances dict-free: attribute reads in the combat
+	# loop resolve through fixed offsets instead of a per-instance dict.
+	__slots__ = ("base_stats", "added_item_stats", "effective_stats", "items",
+				 "_item_counts", "_basic_attack", "_special_attack")
+
 	def __init__(self, base_stats: Stats, added_item_stats: Stats = Stats(),
 				 effective_stats: Stats = None, items: list[BaseItem] = None):
 		"""
@@ -260,12 +338,21 @@ class BaseCharacter(abc.ABC):
 		self.base_stats = base_stats
 		self.added_item_stats = added_item_stats
 
-		if effective_stats is None:
-			self.effective_stats = deepcopy(base_stats)
-		else:
-			self.effective_stats = effective_stats
+		# Stats is immutable, so sharing the base_stats instance is safe and
+		# skips a deepcopy (copy-protocol walk plus memo dict) per character.
+		self.effective_stats = base_stats if effective_stats is None else effective_stats
 
 		self.items = items if items is not None else []
+		# Counter handles duplicate names in a constructor-supplied list; a
+		# plain dict comprehension would undercount them and let a later
+		# add_item keep a unique passive active past the second copy.
+		self._item_counts = Counter(item.name for item in self.items)
+
+		# Lazily cached Attack instances. Attack damage and descriptions only
+		# depend on power stats, which never change mid-combat, so the combat
+		# loop can reuse one instance instead of rebuilding it every turn.
+		self._basic_attack = None
+		self._special_attack = None
 
 	@property
 	@abc.abstractmethod
@@ -310,6 +397,30 @@ class BaseCharacter(abc.ABC):
 		"""
 		pass
 
+	def get_basic_attack(self) -> Attack:
+		"""
+		Returns the character's basic attack, computing it at most once
+		between item changes.
+
+		Returns:
+			Attack: The cached basic attack instance.
+		"""
+		if self._basic_attack is None:
+			self._basic_attack = self.basic_attack
+		return self._basic_attack
+
+	def get_special_attack(self) -> Attack:
+		"""
+		Returns the character's special attack, computing it at most once
+		between item changes.
+
+		Returns:
+			Attack: The cached special attack instance.
+		"""
+		if self._special_attack is None:
+			self._special_attack = self.special_attack
+		return self._special_attack
+
 	def add_item(self, item: BaseItem = None) -> None:
 		"""
 		Adds an item to the character's inventory and updates the effective stats
@@ -332,21 +443,30 @@ class BaseCharacter(abc.ABC):
 		if item is None:
 			raise ValueError("Cannot add None as an item")
 
-		# Counts how many of each item type are held by the character
-		same_item_count = len(list(filter(lambda x: x.name == item.name, self.items)))
+		# Running tally per item name: an O(1) lookup instead of scanning the
+		# item list with a fresh lambda on every add
+		same_item_count = self._item_counts.get(item.name, 0)
 		if item.is_unique_passive and same_item_count > 1:  # Checks if character already has item
 			item.is_passive_active = False  # Removes item's special ability if item is unique passive
 
 		if len(self.items) >= 3:
 			raise ValueError('Too many items')
 		self.items.append(item)
+		self._item_counts[item.name] = same_item_count + 1
+
+		item_stat_changes = item.calculate_effective_stats(self.base_stats)
+		self.added_item_stats = self.added_item_stats.add_stat_changes(item_stat_changes)
 
-		self.added_item_stats = self.added_item_stats.add_stat_changes(item.calculate_effective_stats(self.base_stats))
-		self.effective_stats = self.base_stats  # Reset effective stats to base stats
+		# Folding the new item's delta into the current effective stats is
+		# O(1) per equip like the accumulator, but keeps integer stats integer:
+		# re-deriving from base_stats would route them through the float-zero
+		# defaults of added_item_stats and change the printed damage text.
+		self.effective_stats = self.effective_stats.add_stat_changes(item_stat_changes)
 
-		# Calculate effective stats for each item
-		for item in self.items:
-			self.effective_stats = self.effective_stats.add_stat_changes(item.calculate_effective_stats(self.base_stats))
+		# The stats feeding into the attack formulas changed, so any cached
+		# attacks are stale
+		self._basic_attack = None
+		self._special_attack = None
 
 	def __str__(self) -> str:
 		"""